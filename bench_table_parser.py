@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+戸田市施設予約システム テーブル抽出 検証・ベンチマーク
+fixtures/tables/ に保存したテーブルHTMLを抽出し、期待値（同名の.json）と照合した後、
+抽出のスループット（セル/秒）を計測します。
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from toda_table_parser import extract_availability
+
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures' / 'tables'
+
+
+def load_corpus(fixtures_dir=FIXTURES_DIR):
+    """テーブルHTMLと期待値の組を読み込みます"""
+    corpus = []
+    for html_path in sorted(fixtures_dir.glob('*.html')):
+        expected_path = html_path.with_suffix('.json')
+        with open(html_path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        with open(expected_path, 'r', encoding='utf-8') as f:
+            expected = json.load(f)
+        corpus.append((html_path.stem, html, expected))
+    return corpus
+
+
+def check_corpus(corpus):
+    """抽出結果を期待値と照合し、不一致の件数を返します"""
+    failures = 0
+    for name, html, expected in corpus:
+        actual = extract_availability(html)
+        if actual == expected:
+            print(f"✅ {name}: {len(actual or [])}セル")
+            continue
+        failures += 1
+        print(f"❌ {name}: 期待値と一致しません")
+        expected_cells = expected or []
+        actual_cells = actual or []
+        if len(actual_cells) != len(expected_cells):
+            print(f"  セル数: 期待値 {len(expected_cells)} / 実際 {len(actual_cells)}")
+        for want, got in zip(expected_cells, actual_cells):
+            if want != got:
+                print(f"  期待値: {json.dumps(want, ensure_ascii=False)}")
+                print(f"  実際:   {json.dumps(got, ensure_ascii=False)}")
+                break
+    return failures
+
+
+def benchmark(corpus, iterations):
+    """コーパス全体を繰り返し抽出し、(セル数, 経過秒数) を返します"""
+    cells = 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for _, html, _ in corpus:
+            cells += len(extract_availability(html) or [])
+    return cells, time.perf_counter() - start
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=2000,
+                        help='コーパス全体を抽出する回数（デフォルト: 2000）')
+    parser.add_argument('--check-only', action='store_true',
+                        help='期待値との照合のみ行い、ベンチマークは実行しない')
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    if not corpus:
+        print(f"😔 テーブルHTMLが見つかりません: {FIXTURES_DIR}")
+        return 1
+
+    print("=" * 60)
+    print(f"照合: {len(corpus)}テーブル")
+    print("-" * 60)
+    failures = check_corpus(corpus)
+    if failures:
+        print(f"😔 {failures}件のテーブルが期待値と一致しませんでした")
+        return 1
+
+    if not args.check_only:
+        print("-" * 60)
+        cells, elapsed = benchmark(corpus, args.iterations)
+        print(f"ベンチマーク: {args.iterations}回 × {len(corpus)}テーブル")
+        print(f"セル数: {cells}")
+        print(f"経過時間: {elapsed:.3f}秒")
+        print(f"スループット: {cells / elapsed:,.0f}セル/秒")
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
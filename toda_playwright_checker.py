@@ -15,6 +15,8 @@ import requests
 from playwright.async_api import async_playwright
 from dotenv import load_dotenv
 
+from toda_table_parser import extract_availability
+
 class TodaPlaywrightChecker:
     def __init__(self):
         self.base_url = "https://yoyaku.city.toda.saitama.jp/yoyaku/"
@@ -208,91 +210,14 @@ class TodaPlaywrightChecker:
                 }
             """, timeout=15000)
             
-            # JavaScriptでデータを取得
-            table_data = await page.evaluate("""
+            # テーブルのHTMLを取得し、Python側で空き状況を抽出
+            table_html = await page.evaluate("""
                 () => {
                     const table = document.querySelector('table');
-                    if (!table) return null;
-                    
-                    const allRows = table.querySelectorAll('tr');
-                    if (allRows.length < 2) return null;
-                    
-                    const headerRow = allRows[0];
-                    const dataRows = Array.from(allRows).slice(1);
-                    const headerCells = headerRow.querySelectorAll('th, td');
-                    
-                    const data = [];
-                    const dates = [];
-                    
-                    // ヘッダーから日付を取得（すべてのセルを対象）
-                    headerCells.forEach((cell, index) => {
-                        const text = cell.textContent.trim();
-                        if (text) {
-                            // 日付形式を正規化（例: "07/26 土" -> "07/26"）
-                            const dateMatch = text.match(/(\\d{2}\\/\\d{2})/);
-                            if (dateMatch) {
-                                dates.push(dateMatch[1]);
-                            } else {
-                                dates.push(text);
-                            }
-                        }
-                    });
-                    
-                    console.log('取得した日付:', dates);
-                    console.log('日付数:', dates.length);
-                    console.log('ヘッダーセル数:', headerCells.length);
-                    console.log('データ行数:', dataRows.length);
-                    
-                    // 各行のデータを取得
-                    dataRows.forEach((row, rowIndex) => {
-                        const cells = row.querySelectorAll('td, th');
-                        
-                        cells.forEach((cell, colIndex) => {
-                            if (colIndex < dates.length) {
-                                const date = dates[colIndex];
-                                
-                                // セルのテキストから直接判定（spanの有無に関わらず）
-                                const cellText = cell.textContent.trim();
-                                let status, statusText;
-                                
-                                if (cellText.includes('―')) {
-                                    status = 'unavailable';
-                                    statusText = '予約不可';
-                                } else if (cellText.includes('△')) {
-                                    status = 'available';
-                                    statusText = '予約可能';
-                                } else if (cellText.includes('×')) {
-                                    status = 'booked';
-                                    statusText = '予約済み';
-                                } else {
-                                    status = 'unknown';
-                                    statusText = cellText || '不明';
-                                }
-                                
-                                console.log(`セル[${rowIndex},${colIndex}]: "${cellText}" -> ${status} (${statusText})`);
-                                
-                                // 時間部分を抽出（三角記号などを除去）
-                                let timeText = cellText.split(' ')[0] || '';
-                                // 三角記号、×、―などの記号を除去
-                                timeText = timeText.replace(/[△×―]/g, '').trim();
-                                
-                                data.push({
-                                    date: date,
-                                    time: timeText,
-                                    status: status,
-                                    status_text: statusText,
-                                    raw_text: cellText,
-                                    row: rowIndex,
-                                    col: colIndex
-                                });
-                            }
-                        });
-                    });
-                    
-                    console.log('取得したデータ数:', data.length);
-                    return data;
+                    return table ? table.outerHTML : null;
                 }
             """)
+            table_data = extract_availability(table_html) if table_html else None
             
             if table_data:
                 self.logger.info(f"データ取得成功: {len(table_data)}件")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+戸田市施設予約システム 空き状況テーブル抽出
+保存したテーブルHTMLから空き状況データを抽出します。
+ブラウザ（Playwright）なしで実行できます。
+"""
+
+import re
+from html.parser import HTMLParser
+
+# セル内の記号とステータスの対応（判定は上から順に行う）
+STATUS_SYMBOLS = (
+    ('―', 'unavailable', '予約不可'),
+    ('△', 'available', '予約可能'),
+    ('×', 'booked', '予約済み'),
+)
+
+# 時間部分から除去する記号
+SYMBOL_PATTERN = re.compile('[△×―]')
+
+# 日付形式（例: "07/26 土" -> "07/26"）
+DATE_PATTERN = re.compile(r'([0-9]{2}/[0-9]{2})')
+
+CELL_TAGS = ('td', 'th')
+
+
+class _TableParser(HTMLParser):
+    """最初のtableの行とセルのテキストを収集します"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self._depth = 0
+        self._done = False
+        self._row = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._done:
+            return
+        if tag == 'table':
+            self._depth += 1
+            return
+        if self._depth != 1:
+            return
+        if tag == 'tr':
+            self._close_row()
+            self._row = []
+        elif tag in CELL_TAGS:
+            self._close_cell()
+            if self._row is None:
+                self._row = []
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if self._done or self._depth == 0:
+            return
+        if tag == 'table':
+            self._depth -= 1
+            if self._depth == 0:
+                self._close_row()
+                self._done = True
+            return
+        if self._depth != 1:
+            return
+        if tag == 'tr':
+            self._close_row()
+        elif tag in CELL_TAGS:
+            self._close_cell()
+
+    def handle_data(self, data):
+        # 入れ子のテーブル内のテキストも外側のセルのtextContentに含める
+        if self._cell is not None and not self._done:
+            self._cell.append(data)
+
+    def _close_cell(self):
+        if self._cell is not None:
+            self._row.append(''.join(self._cell).strip())
+            self._cell = None
+
+    def _close_row(self):
+        self._close_cell()
+        if self._row is not None:
+            self.rows.append(self._row)
+            self._row = None
+
+
+def parse_table_rows(html):
+    """最初のtableの各行のセルテキスト（前後の空白を除去）を返します"""
+    parser = _TableParser()
+    parser.feed(html)
+    parser.close()
+    parser._close_row()
+    return parser.rows
+
+
+def normalize_date(text):
+    """ヘッダーのテキストから日付を取り出します（例: "07/26 土" -> "07/26"）"""
+    match = DATE_PATTERN.search(text)
+    return match.group(1) if match else text
+
+
+def classify_cell(cell_text):
+    """セルのテキストからステータスとステータス表示を判定します"""
+    for symbol, status, status_text in STATUS_SYMBOLS:
+        if symbol in cell_text:
+            return status, status_text
+    return 'unknown', cell_text or '不明'
+
+
+def extract_time(cell_text):
+    """セルのテキストから時間部分を取り出します（記号は除去）"""
+    return SYMBOL_PATTERN.sub('', cell_text.split(' ')[0]).strip()
+
+
+def extract_availability(html):
+    """テーブルHTMLから空き状況データを抽出します
+
+    1行目をヘッダーとして日付を取得し、2行目以降の各セルを日付と対応付けます。
+    行数が2未満の場合はNoneを返します。
+    """
+    rows = parse_table_rows(html)
+    if len(rows) < 2:
+        return None
+
+    # ヘッダーから日付を取得（空のセルは除く）
+    dates = [normalize_date(text) for text in rows[0] if text]
+
+    data = []
+    for row_index, cells in enumerate(rows[1:]):
+        for col_index, cell_text in enumerate(cells[:len(dates)]):
+            status, status_text = classify_cell(cell_text)
+            data.append({
+                'date': dates[col_index],
+                'time': extract_time(cell_text),
+                'status': status,
+                'status_text': status_text,
+                'raw_text': cell_text,
+                'row': row_index,
+                'col': col_index,
+            })
+    return data